@@ -20,6 +20,9 @@ from serialization_tools.walkutil import (
 __version__ = "1.0.0"
 StrOrPathLike = Union[str, PathLike[str]]
 
+# Number of entries written per stream.write call in UcsDict.write_stream
+_WRITE_BATCH_SIZE = 0x10000
+
 
 class UcsDict(UserDict[int, str]):
     """
@@ -39,9 +42,14 @@ class UcsDict(UserDict[int, str]):
         written = 0
         items = list(self.data.items())
         if ordered:
-            items = sorted(items)
-        for key, value in items:
-            written += stream.write(f"{key}\t{value}\n")
+            items.sort()
+        # Join lines into a few large writes; writing per-entry pays a Python
+        #   call and an encoder trip per line. Batched to cap peak memory.
+        for start in range(0, len(items), _WRITE_BATCH_SIZE):
+            batch = items[start : start + _WRITE_BATCH_SIZE]
+            written += stream.write(
+                "".join(f"{key}\t{value}\n" for key, value in batch)
+            )
         return written
 
     def write(self, file: StrOrPathLike, ordered: bool = False) -> int:
@@ -88,7 +96,9 @@ class UcsFile(UcsDict):
 
         prev_num: Optional[int] = None
         # prev_str: str = None
-        for line_num, line in enumerate(stream.readlines()):
+        # Iterate the stream directly; readlines() would buffer the whole file
+        #   as a list of lines on top of the text itself
+        for line_num, line in enumerate(stream):
             safe_line = line.lstrip()
             parts = safe_line.split(maxsplit=1)
 
@@ -97,8 +107,6 @@ class UcsFile(UcsDict):
                     raise TypeError(f"Unable to parse line @{line_num}")
                 ucs_file[prev_num] += line
                 continue
-            if len(parts) > 2:
-                raise TypeError(f"Unable to parse line @{line_num}")
             # Try parse ucs ID code
             num_str = parts[0]
             line_str = parts[1].rstrip("\n") if len(parts) >= 2 else ""
@@ -132,6 +140,12 @@ def lang_code_to_name(lang_code: str) -> Optional[str]:
     return LANG_CODE_TABLE.get(lang_code)
 
 
+def _coerce_str(value: StrOrPathLike) -> str:
+    if isinstance(value, PathLike):
+        return os.fspath(value)
+    return value
+
+
 def walk_ucs(
     folder: StrOrPathLike, lang_code: Optional[str] = None
 ) -> Iterable[StrOrPathLike]:
@@ -148,25 +162,17 @@ def walk_ucs(
     walk_result = filter_by_file_extension(walk_result, ".ucs")
     file_walk_result: Iterable[StrOrPathLike] = collapse_walk_on_files(walk_result)
 
-    def coerce_str(value: StrOrPathLike) -> str:
-        if isinstance(value, PathLike):
-            return os.fspath(value)
-        return value
-
     if lang_code:
         lang_name = lang_code_to_name(lang_code)
         if lang_name:
             # bug in filter_by_path
-            coerced_file_walk_result: Iterable[str] = (
-                coerce_str(file) for file in file_walk_result
-            )
-            coerced_file_walk_result = (
-                file for file in coerced_file_walk_result if "Locale" in file
+            # One generator instead of three chained ones; each layer added a
+            #   frame switch per file walked
+            file_walk_result = (
+                file
+                for file in map(_coerce_str, file_walk_result)
+                if "Locale" in file and lang_name in file
             )
-            coerced_file_walk_result = (
-                file for file in coerced_file_walk_result if lang_name in file
-            )
-            file_walk_result = coerced_file_walk_result  # name changed to retype
     return file_walk_result
 
 
@@ -184,16 +190,14 @@ class LangEnvironment(UcsDict):
         self.allow_replacement = allow_replacement
 
     def __setitem__(self, k: int, v: str) -> None:
-        if self.allow_replacement:
-            super(UcsDict, self).__setitem__(k, v)
-        else:
-            try:
-                existing = self.__getitem__(k)
-                raise ValueError(
-                    f"Key '{k}' exists! Trying to replace '{existing}' with '{v}'!"
-                )
-            except KeyError:
-                super(UcsDict, self).__setitem__(k, v)
+        # A membership test is considerably cheaper than raising/catching
+        #   KeyError per insertion; this runs once per translation loaded
+        if not self.allow_replacement and k in self.data:
+            existing = self.data[k]
+            raise ValueError(
+                f"Key '{k}' exists! Trying to replace '{existing}' with '{v}'!"
+            )
+        super(UcsDict, self).__setitem__(k, v)
 
     @classmethod
     def load_environment(
@@ -253,13 +257,23 @@ class LangEnvironment(UcsDict):
 
 __safe_regex = re.compile(r"[^A-Za-z0-9_\- .]")
 _DEFAULT_REPLACEMENT = ""
+# Deletion table for the ASCII fast path; derived from __safe_regex so the
+#   two can't drift apart
+_ASCII_UNSAFE_TABLE: Mapping[int, None] = {
+    i: None for i in range(128) if __safe_regex.match(chr(i))
+}
 
 
 def _file_safe_string(word: str, replace: Optional[str] = None) -> str:
+    if not replace and word.isascii():
+        # str.translate beats a regex substitution for pure-ASCII input,
+        #   which is the overwhelmingly common case for VO strings
+        return word.translate(_ASCII_UNSAFE_TABLE)
+    if not __safe_regex.search(word):  # Already safe; skip the substitution pass
+        return word
     replace = replace or _DEFAULT_REPLACEMENT
-    replace = __safe_regex.sub(
-        _DEFAULT_REPLACEMENT, replace
-    )  # If replace is illegal, use default
+    if __safe_regex.search(replace):  # If replace is illegal, use default
+        replace = __safe_regex.sub(_DEFAULT_REPLACEMENT, replace)
     word = __safe_regex.sub(replace, word)
     return word
 
@@ -298,15 +312,21 @@ def get_lang_string_for_file(
     max_trim = 8
     chars = ".!?"  # ;:," # ORDERED SPECIFICALLY FOR THIS
     for char in chars:
-        if len(replacement) > max_len:
-            replacement = replacement.split(char, 1)[0] + char
-        else:
+        if len(replacement) <= max_len:
             break
+        # Slice at the first occurrence; split() built a throwaway list here
+        index = replacement.find(char)
+        if index != -1:
+            replacement = replacement[: index + 1]
+        else:
+            replacement += char
     # Some brute forcing
     if len(replacement) > max_len:
-        for i in range(max_trim):
-            if replacement[max_len - i - 1] == " ":
-                replacement = replacement[: max_len - i] + "..."
+        # Cut at the earliest space within the trim window; equivalent to the
+        #   old backwards scan, which kept trimming until the lowest hit
+        index = replacement.find(" ", max_len - max_trim, max_len)
+        if index != -1:
+            replacement = replacement[: index + 1] + "..."
     if len(replacement) > max_len:
         replacement = replacement[:max_len] + "..."
 
@@ -1,4 +1,6 @@
+import functools
 import json
+import os
 from io import StringIO
 from pathlib import Path
 from typing import List, Iterable, Tuple, Dict, TextIO
@@ -8,57 +10,80 @@ import pytest
 from relic.ucs import UcsFile
 
 _path = Path(__file__).parent
-try:
-    path = _path / "sources.json"
-    with path.open() as stream:
-        file_sources = json.load(stream)
-except IOError as e:
-    file_sources = {}
 
-if "dirs" not in file_sources:
-    file_sources["dirs"] = []
 
-__implicit_test_data = str(_path / "data")
+def ucs_scan_directory(root_dir: str) -> Iterable[str]:
+    # os.walk with a plain suffix check; Path.glob stats every entry and
+    #   builds a Path object per node
+    for dir_path, _, file_names in os.walk(root_dir):
+        for file_name in file_names:
+            if file_name.endswith(".ucs"):
+                path = os.path.join(dir_path, file_name)
+                if os.path.exists(
+                    path[:-4] + ".json"
+                ):  # ensure expected results file is also present
+                    yield path
 
-if __implicit_test_data not in file_sources["dirs"]:
-    file_sources["dirs"].append(__implicit_test_data)
 
+@functools.lru_cache(maxsize=None)
+def _ucs_test_files() -> List[str]:
+    try:
+        path = _path / "sources.json"
+        with path.open() as stream:
+            file_sources = json.load(stream)
+    except IOError:
+        file_sources = {}
 
-def ucs_scan_directory(root_dir: str) -> Iterable[str]:
-    root_directory = Path(root_dir)
-    for path_object in root_directory.glob("**/*.ucs"):
-        if path_object.with_suffix(
-            ".json"
-        ).exists():  # ensure expected results file is also present
-            yield str(path_object)
+    if "dirs" not in file_sources:
+        file_sources["dirs"] = []
 
+    implicit_test_data = str(_path / "data")
 
-ucs_test_files: List[str] = []
+    if implicit_test_data not in file_sources["dirs"]:
+        file_sources["dirs"].append(implicit_test_data)
 
-for dir in file_sources.get("dirs", []):
-    results = ucs_scan_directory(dir)
-    ucs_test_files.extend(results)
-ucs_test_files.extend(file_sources.get("files", []))
+    # Dedupe the roots before walking; a repeated entry in sources.json would
+    #   otherwise cost a second full scan of the same tree
+    scan_roots = dict.fromkeys(file_sources["dirs"])
 
-ucs_test_files = list(set(ucs_test_files))  # Get unique paths
+    ucs_test_files = {  # Build as a set; unique paths for free
+        file for dir in scan_roots for file in ucs_scan_directory(dir)
+    }
+    ucs_test_files.update(file_sources.get("files", []))
 
+    return sorted(ucs_test_files)  # Stable ordering for test ids
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    # Parametrize lazily; scanning the source directories at import time
+    #   would run even when no UCS test is collected
+    if "ucs_file_path" in metafunc.fixturenames:
+        metafunc.parametrize("ucs_file_path", _ucs_test_files())
 
-class TestLangEnvironment:
-    @pytest.fixture(params=ucs_test_files)
-    def ucs_file_and_data(self, request) -> Tuple[StringIO, Dict[int, str]]:
-        ucs_file: str = request.param
-        p = Path(ucs_file)
-        p = p.with_suffix(".json")
 
-        with open(p, "r") as data:
-            lookup: Dict[str, str] = json.load(data)
-            coerced_lookup: Dict[int, str] = {
-                int(key): value for key, value in lookup.items()
-            }
+@functools.lru_cache(maxsize=None)
+def _read_ucs_case(ucs_file_path: str) -> Tuple[str, Dict[int, str]]:
+    p = Path(ucs_file_path)
+    p = p.with_suffix(".json")
 
-        with open(ucs_file, "r") as ucs_handle:
-            text = ucs_handle.read()
+    with open(p, "r") as data:
+        lookup: Dict[str, str] = json.load(data)
+        coerced_lookup: Dict[int, str] = {
+            int(key): value for key, value in lookup.items()
+        }
 
+    with open(ucs_file_path, "r") as ucs_handle:
+        text = ucs_handle.read()
+
+    return text, coerced_lookup
+
+
+class TestLangEnvironment:
+    @pytest.fixture
+    def ucs_file_and_data(self, ucs_file_path: str) -> Tuple[StringIO, Dict[int, str]]:
+        # The raw text/expected data is cached per path; only the consumable
+        #   StringIO is rebuilt per test
+        text, coerced_lookup = _read_ucs_case(ucs_file_path)
         return StringIO(text), coerced_lookup
 
     def test_ucs(self, ucs_file_and_data: Tuple[TextIO, Dict[int, str]]):